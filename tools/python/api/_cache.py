@@ -0,0 +1,61 @@
+"""
+API: Response Cache Helpers
+Optional Redis cache for serialized responses of read-heavy endpoints
+"""
+
+import hashlib
+import logging
+from typing import Optional
+from redis.exceptions import RedisError
+
+logger = logging.getLogger(__name__)
+
+redis_client = None  # Will be initialized in main app when REDIS_URL is set
+
+def set_redis_client(client):
+    """Set the Redis client instance"""
+    global redis_client
+    redis_client = client
+
+def token_hash(token: str) -> str:
+    """Short, non-reversible cache namespace for a Plex token"""
+    return hashlib.sha256(token.encode()).hexdigest()[:16]
+
+def get(key: str) -> Optional[bytes]:
+    """Return the cached payload for key, or None on a miss or Redis failure"""
+    if redis_client is None:
+        return None
+    try:
+        return redis_client.get(key)
+    except RedisError as e:
+        logger.warning('Redis GET failed for %s: %s', key, e)
+        return None
+
+def put(key: str, payload: bytes, ttl: int):
+    """Cache payload under key for ttl seconds"""
+    if redis_client is None:
+        return
+    try:
+        redis_client.setex(key, ttl, payload)
+    except RedisError as e:
+        logger.warning('Redis SETEX failed for %s: %s', key, e)
+
+def delete(key: str):
+    """Drop a single cached payload"""
+    if redis_client is None:
+        return
+    try:
+        redis_client.delete(key)
+    except RedisError as e:
+        logger.warning('Redis DELETE failed for %s: %s', key, e)
+
+def delete_prefix(prefix: str):
+    """Drop every cached payload whose key starts with prefix"""
+    if redis_client is None:
+        return
+    try:
+        keys = list(redis_client.scan_iter(match=f'{prefix}*'))
+        if keys:
+            redis_client.delete(*keys)
+    except RedisError as e:
+        logger.warning('Redis invalidation failed for %s*: %s', prefix, e)
@@ -0,0 +1,94 @@
+"""
+API: Response Encoding Helpers
+Serializes responses with orjson instead of Flask's stdlib-based jsonify,
+or with CBOR for clients that ask for it via the Accept header
+"""
+
+import orjson
+import cbor2
+from datetime import datetime
+from typing import Dict, Iterable, Iterator
+from flask import Response, request
+
+JSON_MIMETYPE = 'application/json'
+CBOR_MIMETYPE = 'application/cbor'
+
+# Allow int keys and return models.* dataclasses directly
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+
+def dumps(data) -> bytes:
+    """Serialize data to compact JSON bytes"""
+    return orjson.dumps(data, option=ORJSON_OPTIONS)
+
+def make_json_response(data: bytes, status: int = 200) -> Response:
+    """Wrap already-serialized JSON bytes in a Flask response"""
+    return Response(data, status=status, mimetype=JSON_MIMETYPE)
+
+def ojsonify(data, status: int = 200) -> Response:
+    """Drop-in replacement for `jsonify(data), status`"""
+    return make_json_response(dumps(data), status)
+
+def response_mimetype() -> str:
+    """Negotiate JSON (default) or CBOR from the request's Accept header"""
+    best = request.accept_mimetypes.best_match([JSON_MIMETYPE, CBOR_MIMETYPE])
+    return CBOR_MIMETYPE if best == CBOR_MIMETYPE else JSON_MIMETYPE
+
+def _localize(data):
+    """Attach the local zone to naive datetimes, which CBOR can't encode without one"""
+    # plexapi returns naive local times; astimezone() applies the offset in
+    # effect at each value (DST-aware) rather than today's
+    if isinstance(data, datetime):
+        return data if data.tzinfo else data.astimezone()
+    if isinstance(data, dict):
+        return {key: _localize(value) for key, value in data.items()}
+    if isinstance(data, (list, tuple)):
+        return [_localize(value) for value in data]
+    return data
+
+def cbor_dumps(data) -> bytes:
+    """Serialize data to CBOR bytes"""
+    return cbor2.dumps(_localize(data))
+
+def encode(data, mimetype: str) -> bytes:
+    """Serialize data for the given response mimetype"""
+    if mimetype == CBOR_MIMETYPE:
+        return cbor_dumps(data)
+    return dumps(data)
+
+def make_encoded_response(data: bytes, mimetype: str, status: int = 200) -> Response:
+    """Wrap already-encoded bytes in a Flask response negotiated from Accept"""
+    response = Response(data, status=status, mimetype=mimetype)
+    # The body depends on Accept, so caches must not serve CBOR to JSON clients
+    response.vary.add('Accept')
+    return response
+
+def _media_container_chunks(rows: Iterable[Dict]) -> Iterator[bytes]:
+    """Encode rows one at a time as {"MediaContainer":{"Metadata":[...]}}"""
+    yield b'{"MediaContainer":{"Metadata":['
+    separator = b''
+    for row in rows:
+        yield separator + dumps(row)
+        separator = b','
+    yield b']}}'
+
+def _cbor_media_container_chunks(rows: Iterable[Dict]) -> Iterator[bytes]:
+    """CBOR equivalent of _media_container_chunks, using an indefinite-length array"""
+    yield (
+        b'\xa1' + cbor2.dumps('MediaContainer')
+        + b'\xa1' + cbor2.dumps('Metadata')
+        + b'\x9f'
+    )
+    for row in rows:
+        yield cbor_dumps(row)
+    yield b'\xff'
+
+def stream_media_container(rows: Iterable[Dict], status: int = 200) -> Response:
+    """Stream rows as a MediaContainer response without materializing the list"""
+    mimetype = response_mimetype()
+    if mimetype == CBOR_MIMETYPE:
+        chunks = _cbor_media_container_chunks(rows)
+    else:
+        chunks = _media_container_chunks(rows)
+    response = Response(chunks, status=status, mimetype=mimetype)
+    response.vary.add('Accept')
+    return response
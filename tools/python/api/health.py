@@ -3,28 +3,36 @@ API: Health Check Endpoint
 Provides backend status and available features for frontend detection
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint
+from ._json import dumps, make_json_response
 from datetime import datetime
 import config
 
 bp = Blueprint('health', __name__, url_prefix='/api/health')
 
+# The payload is constant apart from the timestamp, so serialize it once and
+# splice the timestamp in per request
+_TIMESTAMP_PLACEHOLDER = b'"__TS__"'
+_HEALTH_TEMPLATE = dumps({
+    'status': 'ok',
+    'version': config.VERSION,
+    'timestamp': '__TS__',
+    'features': [
+        'playlists',
+        'ratings',
+        'recommendations',
+        'smart-playlists',
+    ],
+    'backend': 'python-plexapi',
+    'plex_api_version': '4.17.2',
+})
+
 @bp.route('', methods=['GET', 'OPTIONS'])
 def health_check():
     """
     Health check endpoint for frontend auto-detection
     Returns backend status and available features
     """
-    return jsonify({
-        'status': 'ok',
-        'version': config.VERSION,
-        'timestamp': datetime.now().isoformat(),
-        'features': [
-            'playlists',
-            'ratings',
-            'recommendations',
-            'smart-playlists',
-        ],
-        'backend': 'python-plexapi',
-        'plex_api_version': '4.17.2',
-    }), 200
+    timestamp = datetime.now().isoformat().encode()
+    body = _HEALTH_TEMPLATE.replace(_TIMESTAMP_PLACEHOLDER, b'"' + timestamp + b'"')
+    return make_json_response(body, 200)
@@ -3,8 +3,11 @@ API: Playlists Endpoints
 Handles playlist operations via PlexAPI
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
+from ._json import ojsonify, encode, make_encoded_response, response_mimetype, stream_media_container
+from . import _cache
 import logging
+import config
 from services.plex_service import PlexService
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,10 @@ def set_plex_service(service):
     global plex_service
     plex_service = service
 
+def _playlists_cache_prefix(playlist_type: str = 'audio') -> str:
+    """Cache key prefix for the serialized playlist listing (all formats)"""
+    return f'pl:{_cache.token_hash(plex_service.token)}:{playlist_type}:'
+
 @bp.route('', methods=['GET', 'OPTIONS'])
 def get_playlists():
     """
@@ -25,21 +32,29 @@ def get_playlists():
       - server_id: Specific server to query (optional, defaults to configured server)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
+
+        mimetype = response_mimetype()
+        cache_key = f'{_playlists_cache_prefix()}{mimetype}'
+        cached = _cache.get(cache_key)
+        if cached:
+            return make_encoded_response(cached, mimetype, 200)
 
         playlists = plex_service.get_playlists()
-        return jsonify({
+        payload = encode({
             'MediaContainer': {
                 'Metadata': playlists
             }
-        }), 200
+        }, mimetype)
+        _cache.put(cache_key, payload, config.CACHE_TTL)
+        return make_encoded_response(payload, mimetype, 200)
     except Exception as e:
-        logger.error(f'Error fetching playlists: {str(e)}')
-        return jsonify({
+        logger.error('Error fetching playlists: %s', e)
+        return ojsonify({
             'error': 'Failed to fetch playlists',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @bp.route('/<playlist_id>/items', methods=['GET', 'OPTIONS'])
 def get_playlist_items(playlist_id):
@@ -51,23 +66,20 @@ def get_playlist_items(playlist_id):
       - limit: Number of items to return (default: 50)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         limit = request.args.get('limit', 50, type=int)
-        items = plex_service.get_playlist_items(playlist_id, limit=limit)
+        items = plex_service.iter_playlist_items(playlist_id, limit=limit)
         
-        return jsonify({
-            'MediaContainer': {
-                'Metadata': items
-            }
-        }), 200
+        # Stream rows as they are resolved instead of building the full list
+        return stream_media_container(items, 200)
     except Exception as e:
-        logger.error(f'Error fetching playlist items: {str(e)}')
-        return jsonify({
+        logger.error('Error fetching playlist items: %s', e)
+        return ojsonify({
             'error': 'Failed to fetch playlist items',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @bp.route('', methods=['POST', 'OPTIONS'])
 def create_playlist():
@@ -78,24 +90,25 @@ def create_playlist():
       - description: Playlist description (optional)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         data = request.get_json()
         title = data.get('title')
         description = data.get('description', '')
 
         if not title:
-            return jsonify({'error': 'Playlist title is required'}), 400
+            return ojsonify({'error': 'Playlist title is required'}, 400)
 
         playlist = plex_service.create_playlist(title, description)
-        return jsonify({
+        _cache.delete_prefix(_playlists_cache_prefix())
+        return ojsonify({
             'success': True,
             'playlist': playlist
-        }), 201
+        }, 201)
     except Exception as e:
-        logger.error(f'Error creating playlist: {str(e)}')
-        return jsonify({
+        logger.error('Error creating playlist: %s', e)
+        return ojsonify({
             'error': 'Failed to create playlist',
             'message': str(e)
-        }), 500
+        }, 500)
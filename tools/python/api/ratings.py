@@ -3,8 +3,11 @@ API: Ratings Endpoints
 Handles track rating operations
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
+from ._json import ojsonify, encode, make_encoded_response, response_mimetype
+from . import _cache
 import logging
+import config
 from services.plex_service import PlexService
 
 logger = logging.getLogger(__name__)
@@ -17,6 +20,10 @@ def set_plex_service(service):
     global plex_service
     plex_service = service
 
+def _top_rated_cache_prefix() -> str:
+    """Cache key prefix shared by every cached top-rated query"""
+    return f'tr:{_cache.token_hash(plex_service.token)}:'
+
 @bp.route('/rate', methods=['POST', 'OPTIONS'])
 def rate_track():
     """
@@ -26,31 +33,32 @@ def rate_track():
       - rating: Rating value 0-10 (required)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         data = request.get_json()
         track_key = data.get('track_key')
         rating = data.get('rating')
 
         if not track_key or rating is None:
-            return jsonify({'error': 'track_key and rating are required'}), 400
+            return ojsonify({'error': 'track_key and rating are required'}, 400)
 
         if not (0 <= rating <= 10):
-            return jsonify({'error': 'rating must be between 0 and 10'}), 400
+            return ojsonify({'error': 'rating must be between 0 and 10'}, 400)
 
         result = plex_service.rate_track(track_key, rating)
-        return jsonify({
+        _cache.delete_prefix(_top_rated_cache_prefix())
+        return ojsonify({
             'success': True,
             'message': f'Track rated: {rating}/10',
             'track_key': track_key,
-        }), 200
+        }, 200)
     except Exception as e:
-        logger.error(f'Error rating track: {str(e)}')
-        return jsonify({
+        logger.error('Error rating track: %s', e)
+        return ojsonify({
             'error': 'Failed to rate track',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @bp.route('/top-rated', methods=['GET', 'OPTIONS'])
 def get_top_rated():
@@ -58,27 +66,38 @@ def get_top_rated():
     Get top-rated tracks
     Query params:
       - min_rating: Minimum rating threshold (0-10, default: 7)
-      - limit: Number of tracks to return (default: 50)
+      - limit: Number of tracks to return (positive, default: 50)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         min_rating = request.args.get('min_rating', 7, type=float)
         limit = request.args.get('limit', 50, type=int)
 
+        if limit <= 0:
+            return ojsonify({'error': 'limit must be a positive integer'}, 400)
+
+        mimetype = response_mimetype()
+        cache_key = f'{_top_rated_cache_prefix()}{min_rating}:{limit}:{mimetype}'
+        cached = _cache.get(cache_key)
+        if cached:
+            return make_encoded_response(cached, mimetype, 200)
+
         tracks = plex_service.get_top_rated_tracks(min_rating, limit)
-        return jsonify({
+        payload = encode({
             'tracks': tracks,
             'count': len(tracks),
             'min_rating': min_rating,
-        }), 200
+        }, mimetype)
+        _cache.put(cache_key, payload, config.CACHE_TTL)
+        return make_encoded_response(payload, mimetype, 200)
     except Exception as e:
-        logger.error(f'Error fetching top-rated tracks: {str(e)}')
-        return jsonify({
+        logger.error('Error fetching top-rated tracks: %s', e)
+        return ojsonify({
             'error': 'Failed to fetch top-rated tracks',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @bp.route('/sync', methods=['POST', 'OPTIONS'])
 def sync_ratings():
@@ -89,21 +108,23 @@ def sync_ratings():
       - dry_run: Boolean, test without applying changes (default: true)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         data = request.get_json()
         source = data.get('source')
         dry_run = data.get('dry_run', True)
 
         if not source:
-            return jsonify({'error': 'source is required'}), 400
+            return ojsonify({'error': 'source is required'}, 400)
 
         result = plex_service.sync_ratings_from_source(source, dry_run=dry_run)
-        return jsonify(result), 200
+        if not dry_run and result.get('synced'):
+            _cache.delete_prefix(_top_rated_cache_prefix())
+        return ojsonify(result, 200)
     except Exception as e:
-        logger.error(f'Error syncing ratings: {str(e)}')
-        return jsonify({
+        logger.error('Error syncing ratings: %s', e)
+        return ojsonify({
             'error': 'Failed to sync ratings',
             'message': str(e)
-        }), 500
+        }, 500)
@@ -3,7 +3,8 @@ API: Recommendations Endpoints
 Handles AI-powered music recommendations
 """
 
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request
+from ._json import ojsonify
 import logging
 from services.plex_service import PlexService
 
@@ -26,26 +27,26 @@ def get_similar_tracks():
       - limit: Number of recommendations (default: 10)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         track_key = request.args.get('track_key')
         limit = request.args.get('limit', 10, type=int)
 
         if not track_key:
-            return jsonify({'error': 'track_key is required'}), 400
+            return ojsonify({'error': 'track_key is required'}, 400)
 
         recommendations = plex_service.get_similar_tracks(track_key, limit=limit)
-        return jsonify({
+        return ojsonify({
             'recommendations': recommendations,
             'count': len(recommendations),
-        }), 200
+        }, 200)
     except Exception as e:
-        logger.error(f'Error getting recommendations: {str(e)}')
-        return jsonify({
+        logger.error('Error getting recommendations: %s', e)
+        return ojsonify({
             'error': 'Failed to get recommendations',
             'message': str(e)
-        }), 500
+        }, 500)
 
 @bp.route('/based-on-ratings', methods=['GET', 'OPTIONS'])
 def get_recommendations_based_on_ratings():
@@ -56,8 +57,8 @@ def get_recommendations_based_on_ratings():
       - limit: Number of recommendations (default: 10)
     """
     try:
-        if not plex_service:
-            return jsonify({'error': 'Plex service not initialized'}), 500
+        if plex_service.needs_retry and not plex_service.reconnect():
+            return ojsonify({'error': 'Plex service not initialized'}, 500)
 
         min_rating = request.args.get('min_rating', 8, type=float)
         limit = request.args.get('limit', 10, type=int)
@@ -66,14 +67,14 @@ def get_recommendations_based_on_ratings():
             min_rating=min_rating,
             limit=limit
         )
-        return jsonify({
+        return ojsonify({
             'recommendations': recommendations,
             'count': len(recommendations),
             'based_on_rating': min_rating,
-        }), 200
+        }, 200)
     except Exception as e:
-        logger.error(f'Error getting recommendations: {str(e)}')
-        return jsonify({
+        logger.error('Error getting recommendations: %s', e)
+        return ojsonify({
             'error': 'Failed to get recommendations',
             'message': str(e)
-        }), 500
+        }, 500)
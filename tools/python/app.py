@@ -12,12 +12,16 @@ Usage:
     python app.py
     
     Then access at: http://localhost:5000/api/health
+
+    On macOS/Linux, serve with gevent workers instead of the dev server:
+    gunicorn app:app
 """
 
 import logging
 import sys
-from flask import Flask, jsonify
-from flask_cors import CORS
+import redis
+from flask import Flask, Response, request
+from flask.json.provider import DefaultJSONProvider
 from datetime import datetime
 
 # Import configuration and services
@@ -26,6 +30,8 @@ from services.plex_service import PlexService
 
 # Import API blueprints
 from api import health, playlists, ratings, recommendations
+from api import _cache
+from api._json import ojsonify
 
 # Configure logging
 logging.basicConfig(
@@ -34,45 +40,77 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+class CompactJSONProvider(DefaultJSONProvider):
+    """Stdlib JSON provider that always emits compact, unsorted output"""
+    compact = True
+    sort_keys = False
+    ensure_ascii = False
+
+    def dumps(self, obj, **kwargs):
+        kwargs.setdefault('separators', (',', ':'))
+        return super().dumps(obj, **kwargs)
+
 # Initialize Flask app
 app = Flask(__name__)
 
-# Configure CORS
-CORS(app, resources={
-    r"/api/*": {
-        "origins": config.CORS_ORIGINS,
-        "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Authorization"],
-        "supports_credentials": False,
-    }
-})
+# Keep any stdlib JSON output (Flask internals, extensions) compact and unsorted,
+# even in debug mode. JSONIFY_PRETTYPRINT_REGULAR / JSON_SORT_KEYS were removed
+# in Flask 2.3, so this is configured on the JSON provider instead.
+app.json = CompactJSONProvider(app)
 
-# Initialize Plex service
-plex_service = None
+# Configure CORS. Origins are a fixed list, so a frozenset lookup and
+# precomputed preflight headers replace Flask-CORS's per-request matching.
+_ALLOWED_ORIGINS = frozenset(config.CORS_ORIGINS)
+PREFLIGHT_HEADERS = {
+    'Access-Control-Allow-Methods': ', '.join(config.CORS_METHODS),
+    'Access-Control-Allow-Headers': ', '.join(config.CORS_HEADERS),
+    'Access-Control-Max-Age': str(config.CORS_MAX_AGE),
+}
 
 @app.before_request
-def initialize_services():
-    """Initialize services before first request"""
-    global plex_service
-    
-    if plex_service is None:
-        try:
-            logger.info('Initializing Plex service...')
-            plex_service = PlexService(
-                server_url=config.PLEX_SERVER_URL,
-                token=config.PLEX_TOKEN,
-                client_id=config.PLEX_CLIENT_ID,
-            )
-            
-            # Set service in all API modules
-            playlists.set_plex_service(plex_service)
-            ratings.set_plex_service(plex_service)
-            recommendations.set_plex_service(plex_service)
-            
-            logger.info('Plex service initialized successfully')
-        except Exception as e:
-            logger.error(f'Failed to initialize Plex service: {str(e)}')
-            # Service will be retried on next request
+def handle_preflight():
+    """Short-circuit CORS preflight requests before routing/view dispatch"""
+    if request.method != 'OPTIONS':
+        return None
+    return Response(b'', 204, headers=PREFLIGHT_HEADERS)
+
+@app.after_request
+def add_cors_headers(response):
+    """Echo the request origin back when it is allowed"""
+    origin = request.origin
+    if origin in _ALLOWED_ORIGINS:
+        response.headers['Access-Control-Allow-Origin'] = origin
+    response.vary.add('Origin')
+    return response
+
+# Initialize response cache (optional)
+if config.REDIS_URL:
+    _cache.set_redis_client(redis.Redis.from_url(config.REDIS_URL))
+    logger.info('Response cache enabled')
+
+# Create the Plex service without connecting. Importing the app must not
+# block on an unreachable Plex host: Gunicorn only starts the worker heartbeat
+# once the app is loaded, so a slow connect here gets the worker killed in a
+# restart loop. The first request connects via the needs_retry path.
+plex_service = PlexService(
+    server_url=config.PLEX_SERVER_URL,
+    token=config.PLEX_TOKEN,
+    client_id=config.PLEX_CLIENT_ID,
+    connect=False,
+)
+
+def connect_plex_service():
+    """Connect to Plex ahead of the first request (development server only)"""
+    logger.info('Initializing Plex service...')
+    if plex_service.reconnect():
+        logger.info('Plex service initialized successfully')
+    else:
+        logger.error('Failed to initialize Plex service, will retry on next request')
+
+# Set service in all API modules
+playlists.set_plex_service(plex_service)
+ratings.set_plex_service(plex_service)
+recommendations.set_plex_service(plex_service)
 
 # Register API blueprints
 app.register_blueprint(health.bp)
@@ -84,33 +122,25 @@ app.register_blueprint(recommendations.bp)
 @app.errorhandler(404)
 def not_found(error):
     """Handle 404 errors"""
-    return jsonify({
+    return ojsonify({
         'error': 'Not Found',
         'message': 'The requested endpoint does not exist',
-    }), 404
+    }, 404)
 
 @app.errorhandler(500)
 def internal_error(error):
     """Handle 500 errors"""
-    logger.error(f'Internal server error: {str(error)}')
-    return jsonify({
+    logger.error('Internal server error: %s', error)
+    return ojsonify({
         'error': 'Internal Server Error',
         'message': 'An unexpected error occurred',
-    }), 500
-
-@app.errorhandler(cors.CORSRequestDidNotMatch)
-def cors_error(error):
-    """Handle CORS errors"""
-    return jsonify({
-        'error': 'CORS Error',
-        'message': 'Cross-origin request not allowed',
-    }), 403
+    }, 500)
 
 # Root endpoint
 @app.route('/', methods=['GET'])
 def root():
     """Root endpoint with API information"""
-    return jsonify({
+    return ojsonify({
         'name': 'PlexM8 Local Backend',
         'version': config.VERSION,
         'status': 'running',
@@ -121,23 +151,25 @@ def root():
             'ratings': '/api/ratings',
             'recommendations': '/api/recommendations',
         }
-    }), 200
+    }, 200)
 
 def main():
     """Main entry point"""
     logger.info('=' * 60)
     logger.info('PlexM8 Local Backend')
     logger.info('=' * 60)
-    logger.info(f'Configuration:')
-    logger.info(f'  Host: {config.HOST}')
-    logger.info(f'  Port: {config.PORT}')
-    logger.info(f'  Debug: {config.DEBUG}')
-    logger.info(f'  Plex Server: {config.PLEX_SERVER_URL}')
-    logger.info(f'  Allowed Origins: {", ".join(config.CORS_ORIGINS)}')
+    logger.info('Configuration:')
+    logger.info('  Host: %s', config.HOST)
+    logger.info('  Port: %s', config.PORT)
+    logger.info('  Debug: %s', config.DEBUG)
+    logger.info('  Plex Server: %s', config.PLEX_SERVER_URL)
+    logger.info('  Allowed Origins: %s', ', '.join(config.CORS_ORIGINS))
     logger.info('=' * 60)
     
+    connect_plex_service()
+    
     try:
-        logger.info(f'Starting server on http://{config.HOST}:{config.PORT}')
+        logger.info('Starting server on http://%s:%s', config.HOST, config.PORT)
         app.run(
             host=config.HOST,
             port=config.PORT,
@@ -148,7 +180,7 @@ def main():
         logger.info('Shutting down...')
         sys.exit(0)
     except Exception as e:
-        logger.error(f'Failed to start server: {str(e)}')
+        logger.error('Failed to start server: %s', e)
         sys.exit(1)
 
 if __name__ == '__main__':
@@ -19,6 +19,10 @@ PLEX_SERVER_URL = os.getenv('PLEX_SERVER_URL', 'http://localhost:32400')
 PLEX_TOKEN = os.getenv('PLEX_TOKEN', '')
 PLEX_CLIENT_ID = os.getenv('PLEX_CLIENT_ID', 'PlexM8-Local-Backend')
 
+# Response Cache Configuration (optional, disabled when REDIS_URL is empty)
+REDIS_URL = os.getenv('REDIS_URL', '')
+CACHE_TTL = int(os.getenv('CACHE_TTL', '60'))
+
 # Logging Configuration
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_DIR = os.path.join(os.path.dirname(__file__), 'logs')
@@ -31,6 +35,9 @@ CORS_ORIGINS = [
     'http://127.0.0.1:5173',
     'https://plexm8.netlify.app',
 ]
+CORS_METHODS = ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS']
+CORS_HEADERS = ['Content-Type', 'Authorization']
+CORS_MAX_AGE = 600  # Seconds browsers may cache a preflight result
 
 # Version
 VERSION = '1.0.0'
@@ -0,0 +1,19 @@
+"""
+PlexM8 Local Backend Gunicorn Configuration
+Serves the Flask app with gevent workers (macOS/Linux only)
+
+Usage:
+    gunicorn app:app
+"""
+
+# Import settings by name: a module named `config` would clash with
+# Gunicorn's own `config` setting
+from config import HOST, PORT, LOG_LEVEL
+
+# The gevent worker monkey-patches sockets before app.py is imported, so
+# concurrent Plex requests share one OS thread instead of one thread each
+bind = f'{HOST}:{PORT}'
+workers = 1
+worker_class = 'gevent'
+worker_connections = 200
+loglevel = LOG_LEVEL.lower()
@@ -2,11 +2,15 @@
 Data models for PlexM8 Local Backend
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Optional, List
 
+# slots=True needs Python 3.10+; fall back to regular frozen dataclasses on 3.9
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(frozen=True, **_SLOTS)
 class Track:
     """Music track model"""
     key: str
@@ -19,7 +23,7 @@ class Track:
     index: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Playlist:
     """Playlist model"""
     key: str
@@ -34,7 +38,7 @@ class Playlist:
     updated_at: Optional[int] = None
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class Recommendation:
     """Music recommendation model"""
     track: Track
@@ -42,7 +46,7 @@ class Recommendation:
     reason: str
 
 
-@dataclass
+@dataclass(frozen=True, **_SLOTS)
 class RatingSync:
     """Rating synchronization result"""
     source: str  # 'itunes', 'foobar2000', etc.
@@ -4,16 +4,49 @@ Wrapper around PlexAPI for consistent interface and error handling
 """
 
 import logging
-from typing import List, Dict, Optional
+import math
+import threading
+from typing import List, Dict, Iterator, Optional
+import requests
+from cachetools import TTLCache, cachedmethod
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from plexapi.server import PlexServer
-from plexapi.exceptions import Unauthorized, BadRequest
+from plexapi.exceptions import Unauthorized, BadRequest, NotFound
+from .serializers import playlist_row, track_row, top_rated_row
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive pool for Plex requests; maxsize should cover Flask's worker threads
+PLEX_POOL_CONNECTIONS = 4
+PLEX_POOL_MAXSIZE = 32
+PLEX_MAX_RETRIES = Retry(total=2, backoff_factor=0.2)
+
+# Rating endpoint; only needs the item's ratingKey, not its full metadata
+RATE_PATH = '/:/rate'
+RATE_IDENTIFIER = 'com.plexapp.plugins.library'
+
+# Plex stores userRating on the same 0-10 scale the API uses (10 = 5 stars)
+MAX_RATING = 10
+
+# Resolved Playlist objects, reused across repeated item requests
+PLAYLIST_CACHE_SIZE = 256
+PLAYLIST_CACHE_TTL = 30  # seconds
+
+def _rating_key(track_key: str) -> str:
+    """Extract the ratingKey from '/library/metadata/<id>' (or a bare '<id>')"""
+    return track_key.rsplit('/', 1)[-1]
+
 class PlexService:
     """Service for interacting with Plex Media Server via PlexAPI"""
 
-    def __init__(self, server_url: str, token: str, client_id: str = 'PlexM8-Local-Backend'):
+    def __init__(
+        self,
+        server_url: str,
+        token: str,
+        client_id: str = 'PlexM8-Local-Backend',
+        connect: bool = True
+    ):
         """
         Initialize Plex service
         
@@ -21,25 +54,75 @@ class PlexService:
             server_url: Base URL of Plex server (e.g., http://192.168.1.100:32400)
             token: Plex API token
             client_id: Client identifier for Plex API headers
+            connect: Connect immediately (otherwise call reconnect() later)
         """
         self.server_url = server_url
         self.token = token
         self.client_id = client_id
         self.plex = None
-        self._connect()
+        self._session = None
+        self._music = None
+        self._pl_cache = TTLCache(maxsize=PLAYLIST_CACHE_SIZE, ttl=PLAYLIST_CACHE_TTL)
+        self._pl_cache_lock = threading.Lock()
+        self.needs_retry = True
+        if connect:
+            self._connect()
+
+    def _create_session(self) -> requests.Session:
+        """Create a connection-pooled HTTP session for Plex requests"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=PLEX_POOL_CONNECTIONS,
+            pool_maxsize=PLEX_POOL_MAXSIZE,
+            max_retries=PLEX_MAX_RETRIES,
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
 
     def _connect(self):
         """Connect to Plex server"""
         try:
-            self.plex = PlexServer(self.server_url, self.token)
-            logger.info(f'Connected to Plex server: {self.server_url}')
+            self._session = self._create_session()
+            self.plex = PlexServer(self.server_url, self.token, session=self._session)
+            logger.info('Connected to Plex server: %s', self.server_url)
+            self._music = self._get_music_section()
+            with self._pl_cache_lock:
+                self._pl_cache.clear()
+            self.needs_retry = False
         except Unauthorized:
             logger.error('Invalid Plex token')
             raise
         except Exception as e:
-            logger.error(f'Failed to connect to Plex server: {str(e)}')
+            logger.error('Failed to connect to Plex server: %s', e)
             raise
 
+    def reconnect(self) -> bool:
+        """
+        Retry a failed connection to the Plex server
+        
+        Returns:
+            True if connected
+        """
+        try:
+            self._connect()
+            return True
+        except Exception:
+            return False
+
+    def _get_music_section(self):
+        """Look up the 'Music' library section, or None if the server has none"""
+        try:
+            return self.plex.library.section('Music')
+        except NotFound:
+            logger.warning('No Music library section found on Plex server')
+            return None
+
+    @cachedmethod(lambda self: self._pl_cache, lock=lambda self: self._pl_cache_lock)
+    def _resolve_playlist(self, playlist_key: str):
+        """Look up a playlist by key, cached for PLAYLIST_CACHE_TTL seconds"""
+        return self.plex.playlist(playlist_key)
+
     def get_playlists(self, playlist_type: str = 'audio') -> List[Dict]:
         """
         Get all playlists for the authenticated user
@@ -55,60 +138,60 @@ class PlexService:
             
             result = []
             for pl in playlists:
-                if hasattr(pl, 'playlistType') and pl.playlistType == playlist_type:
-                    result.append({
-                        'key': pl.key,
-                        'title': pl.title,
-                        'type': getattr(pl, 'playlistType', 'audio'),
-                        'smart': getattr(pl, 'smart', 0),
-                        'summary': getattr(pl, 'summary', ''),
-                        'leafCount': getattr(pl, 'leafCount', 0),
-                        'thumb': getattr(pl, 'thumb', ''),
-                        'icon': getattr(pl, 'icon', ''),
-                        'addedAt': getattr(pl, 'addedAt', None),
-                        'updatedAt': getattr(pl, 'updatedAt', None),
-                    })
+                row = playlist_row(pl)
+                if row['type'] == playlist_type:
+                    result.append(row)
             
-            logger.info(f'Retrieved {len(result)} playlists')
+            logger.info('Retrieved %d playlists', len(result))
             return result
         except Exception as e:
-            logger.error(f'Error getting playlists: {str(e)}')
+            logger.error('Error getting playlists: %s', e)
             raise
 
-    def get_playlist_items(self, playlist_key: str, limit: int = 50) -> List[Dict]:
+    def iter_playlist_items(self, playlist_key: str, limit: int = 50) -> Iterator[Dict]:
         """
-        Get items in a specific playlist
+        Resolve a playlist and serialize its items lazily, in playlist order
+        
+        The playlist lookup happens immediately so lookup errors raise here;
+        rows are built as the iterator is consumed.
         
         Args:
             playlist_key: Playlist key/id
             limit: Maximum number of items to return
             
         Returns:
-            List of track dictionaries
+            Iterator of track dictionaries
         """
         try:
-            playlist = self.plex.playlist(playlist_key)
-            items = playlist.items()[:limit]
-            
-            result = []
-            for item in items:
-                result.append({
-                    'key': item.key,
-                    'title': getattr(item, 'title', ''),
-                    'artist': getattr(item, 'artist', ''),
-                    'album': getattr(item, 'album', ''),
-                    'duration': getattr(item, 'duration', 0),
-                    'userRating': getattr(item, 'userRating', None),
-                    'thumb': getattr(item, 'thumb', ''),
-                    'index': getattr(item, 'index', None),
-                })
-            
-            logger.info(f'Retrieved {len(result)} items from playlist {playlist_key}')
-            return result
+            playlist = self._resolve_playlist(playlist_key)
+            items = self._fetch_playlist_items(playlist, limit)
+            logger.info('Retrieved %d items from playlist %s', len(items), playlist_key)
+            return map(track_row, items)
         except Exception as e:
-            logger.error(f'Error getting playlist items: {str(e)}')
+            logger.error('Error getting playlist items: %s', e)
             raise
 
+    def _fetch_playlist_items(self, playlist, limit: int) -> List:
+        """
+        Fetch only the first `limit` items of a playlist
+        
+        playlist.items() downloads and parses every item before we can slice
+        it; requesting a bounded container window makes Plex send just the
+        rows we return.
+        """
+        if playlist.radio or limit <= 0:
+            return []
+        items = playlist.fetchItems(
+            f'{playlist.key}/items',
+            container_start=0,
+            container_size=limit,
+            maxresults=limit,
+        )
+        if any(item.sourceURI for item in items):
+            # Items shared from other servers need plexapi's server re-binding
+            return playlist.items()[:limit]
+        return items
+
     def create_playlist(self, title: str, description: str = '', items: List = None) -> Dict:
         """
         Create a new playlist
@@ -124,7 +207,7 @@ class PlexService:
         try:
             playlist = self.plex.createPlaylist(title, items=items or [])
             
-            logger.info(f'Created playlist: {title}')
+            logger.info('Created playlist: %s', title)
             return {
                 'key': playlist.key,
                 'title': playlist.title,
@@ -132,12 +215,12 @@ class PlexService:
                 'itemCount': getattr(playlist, 'leafCount', 0),
             }
         except Exception as e:
-            logger.error(f'Error creating playlist: {str(e)}')
+            logger.error('Error creating playlist: %s', e)
             raise
 
     def rate_track(self, track_key: str, rating: float) -> bool:
         """
-        Rate a track (0-10 scale, converted to Plex's 0-10 * 2 scale internally)
+        Rate a track (0-10 scale, the same scale Plex stores)
         
         Args:
             track_key: Track metadata key
@@ -147,14 +230,25 @@ class PlexService:
             True if successful
         """
         try:
-            # Plex stores ratings 0-10, we accept 0-10 and convert to internal scale
-            track = self.plex.library.getByKey(track_key)
-            track.rate(rating * 2)  # Plex uses 0-20 internally
+            # Same check plexapi's rate() applies before writing
+            if not isinstance(rating, (int, float)) or not 0 <= rating <= MAX_RATING:
+                raise BadRequest(f'Rating must be between 0 and {MAX_RATING}')
+            
+            # Rate by ratingKey directly instead of fetching the track's metadata first
+            self.plex.query(
+                RATE_PATH,
+                method=self._session.put,
+                params={
+                    'key': _rating_key(track_key),
+                    'identifier': RATE_IDENTIFIER,
+                    'rating': rating,
+                },
+            )
             
-            logger.info(f'Rated track {track_key}: {rating}/10')
+            logger.info('Rated track %s: %s/10', track_key, rating)
             return True
         except Exception as e:
-            logger.error(f'Error rating track: {str(e)}')
+            logger.error('Error rating track: %s', e)
             raise
 
     def get_top_rated_tracks(self, min_rating: float = 7, limit: int = 50) -> List[Dict]:
@@ -169,37 +263,28 @@ class PlexService:
             List of top-rated track dictionaries
         """
         try:
-            music = self.plex.library.section('Music')
-            all_tracks = music.all()
-            
-            # Filter by rating
-            rated_tracks = [
-                t for t in all_tracks 
-                if hasattr(t, 'userRating') and t.userRating is not None
-                and t.userRating >= min_rating * 2  # Plex stores as 0-20
-            ]
-            
-            # Sort by rating descending
-            rated_tracks.sort(
-                key=lambda x: getattr(x, 'userRating', 0),
-                reverse=True
+            if self._music is None:
+                self._music = self._get_music_section()
+            if self._music is None:
+                raise NotFound('Music library section not found')
+
+            # Let Plex filter, sort and limit server-side so only `limit`
+            # tracks come over the wire. '>>' is a strict comparison and
+            # star ratings are whole numbers on Plex's 0-10 scale, so step
+            # the threshold down by one to keep it inclusive.
+            rated_tracks = self._music.search(
+                libtype='track',
+                filters={'userRating>>': math.ceil(min_rating) - 1},
+                sort='userRating:desc',
+                maxresults=limit,
             )
             
-            result = []
-            for track in rated_tracks[:limit]:
-                result.append({
-                    'key': track.key,
-                    'title': getattr(track, 'title', ''),
-                    'artist': getattr(track, 'artist', ''),
-                    'album': getattr(track, 'album', ''),
-                    'userRating': (getattr(track, 'userRating', 0) or 0) / 2,  # Convert back to 0-10
-                    'thumb': getattr(track, 'thumb', ''),
-                })
+            result = [top_rated_row(track) for track in rated_tracks]
             
-            logger.info(f'Retrieved {len(result)} top-rated tracks (min: {min_rating})')
+            logger.info('Retrieved %d top-rated tracks (min: %s)', len(result), min_rating)
             return result
         except Exception as e:
-            logger.error(f'Error getting top-rated tracks: {str(e)}')
+            logger.error('Error getting top-rated tracks: %s', e)
             raise
 
     def sync_ratings_from_source(self, source: str, dry_run: bool = True) -> Dict:
@@ -214,7 +299,9 @@ class PlexService:
             Dictionary with sync results
         """
         try:
-            # This is a stub - will be implemented per platform
+            # This is a stub - will be implemented per platform. The
+            # /api/ratings/sync endpoint drops cached top-rated results
+            # whenever a non-dry run reports synced tracks.
             if source.lower() == 'itunes':
                 return self._sync_itunes_ratings(dry_run=dry_run)
             elif source.lower() == 'foobar2000':
@@ -222,7 +309,7 @@ class PlexService:
             else:
                 raise ValueError(f'Unsupported source: {source}')
         except Exception as e:
-            logger.error(f'Error syncing ratings: {str(e)}')
+            logger.error('Error syncing ratings: %s', e)
             raise
 
     def _sync_itunes_ratings(self, dry_run: bool = True) -> Dict:
@@ -264,7 +351,7 @@ class PlexService:
                 'recommendations': [],
             }
         except Exception as e:
-            logger.error(f'Error getting similar tracks: {str(e)}')
+            logger.error('Error getting similar tracks: %s', e)
             raise
 
     def get_recommendations_based_on_ratings(
@@ -290,5 +377,5 @@ class PlexService:
                 'recommendations': [],
             }
         except Exception as e:
-            logger.error(f'Error getting recommendations: {str(e)}')
+            logger.error('Error getting recommendations: %s', e)
             raise
@@ -0,0 +1,58 @@
+"""
+Row Serializers
+Per-row dictionary builders for PlexAPI objects
+
+Kept free of Flask/PlexAPI imports so it can optionally be compiled with
+mypyc (see README); the pure-Python module is used when no build exists.
+"""
+
+from typing import Any, Dict
+
+# Rows are read straight from each object's __dict__. plexapi populates
+# plain attributes there from the list response; going through getattr would
+# hit PlexPartialObject.__getattribute__, which re-fetches the full item from
+# Plex whenever a field is None (e.g. every unrated track's userRating).
+# Playlists expose their thumbnail as `composite`; tracks expose artist/album
+# as grandparent/parent titles.
+
+def playlist_row(pl: Any) -> Dict[str, Any]:
+    """Build the API dictionary for a playlist"""
+    d = pl.__dict__
+    return {
+        'key': d.get('key', ''),
+        'title': d.get('title', ''),
+        'type': d.get('playlistType'),
+        'smart': d.get('smart', 0),
+        'summary': d.get('summary', ''),
+        'leafCount': d.get('leafCount', 0),
+        'thumb': d.get('composite', ''),
+        'icon': d.get('icon', ''),
+        'addedAt': d.get('addedAt'),
+        'updatedAt': d.get('updatedAt'),
+    }
+
+def track_row(item: Any) -> Dict[str, Any]:
+    """Build the API dictionary for a playlist item"""
+    d = item.__dict__
+    return {
+        'key': d.get('key', ''),
+        'title': d.get('title', ''),
+        'artist': d.get('grandparentTitle', ''),
+        'album': d.get('parentTitle', ''),
+        'duration': d.get('duration', 0),
+        'userRating': d.get('userRating'),
+        'thumb': d.get('thumb', ''),
+        'index': d.get('index'),
+    }
+
+def top_rated_row(track: Any) -> Dict[str, Any]:
+    """Build the API dictionary for a top-rated track"""
+    d = track.__dict__
+    return {
+        'key': d.get('key', ''),
+        'title': d.get('title', ''),
+        'artist': d.get('grandparentTitle', ''),
+        'album': d.get('parentTitle', ''),
+        'userRating': d.get('userRating') or 0,
+        'thumb': d.get('thumb', ''),
+    }
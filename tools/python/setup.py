@@ -6,11 +6,50 @@ Cross-platform (Windows, macOS, Linux)
 """
 
 import os
+import re
 import sys
+import argparse
+import hashlib
+import time
+import shutil
 import subprocess
 import venv
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Digest of the last successfully installed requirements, stored inside the venv
+REQ_DIGEST_FILE = '.plexm8-req.sha256'
+
+# Hashed, fully pinned requirements generated by pip-compile (see ensure_lockfile)
+LOCK_FILE = 'requirements.lock'
+
+# Local wheel directory filled by prefetch_wheels when --wheelhouse is given
+WHEELHOUSE_DIR = 'wheelhouse'
+
+# Flags for every pip run: no self-update check, no prompts, wheels over sdists,
+# and plain line output for run_streaming
+PIP_BASE = ['--disable-pip-version-check', '--no-input', '--prefer-binary', '--progress-bar', 'off']
+
+# pip output lines worth showing live; the rest is kept only for error reports
+PIP_EVENTS = ('Collecting', 'Building wheel', 'Installing collected', 'Successfully', 'ERROR', 'WARNING')
+
+# Platform and interpreter details, resolved once at import
+_IS_WINDOWS = sys.platform == 'win32'
+_VENV_BIN = 'Scripts' if _IS_WINDOWS else 'bin'
+_PY_EXE = 'python.exe' if _IS_WINDOWS else 'python'
+_PY_VERSION = sys.version_info[:3]
+_MIN_PY_VERSION = (3, 9)
+_SCRIPT_DIR = Path(__file__).parent
+
+# Packages validate_installation expects in the venv: import name -> distribution name
+REQUIRED_PACKAGES = {
+    'flask': 'Flask',
+    'plexapi': 'PlexAPI',
+    'dotenv': 'python-dotenv',
+    'requests': 'requests',
+}
+
 # ANSI color codes for terminal output
 class Colors:
     BLUE = '\033[94m'
@@ -20,11 +59,14 @@ class Colors:
     RESET = '\033[0m'
     BOLD = '\033[1m'
 
+# Escape codes only add noise to redirected output such as CI logs
+if not sys.stdout.isatty():
+    Colors.BLUE = Colors.GREEN = Colors.YELLOW = Colors.RED = Colors.RESET = Colors.BOLD = ''
+
 def print_header(msg):
     """Print a formatted header message"""
-    print(f"\n{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{msg}{Colors.RESET}")
-    print(f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}\n")
+    rule = f"{Colors.BOLD}{Colors.BLUE}{'='*60}{Colors.RESET}"
+    print(f"\n{rule}\n{Colors.BOLD}{Colors.BLUE}{msg}{Colors.RESET}\n{rule}\n")
 
 def print_success(msg):
     """Print a success message"""
@@ -46,11 +88,10 @@ def check_python_version():
     """Check if Python version is compatible (3.9+)"""
     print_header("Checking Python Version")
     
-    version_info = sys.version_info
-    version_str = f"{version_info.major}.{version_info.minor}.{version_info.micro}"
+    version_str = '.'.join(map(str, _PY_VERSION))
     print_info(f"Found Python {version_str}")
     
-    if version_info.major < 3 or (version_info.major == 3 and version_info.minor < 9):
+    if _PY_VERSION < _MIN_PY_VERSION:
         print_error(f"Python 3.9+ is required (found {version_str})")
         sys.exit(1)
     
@@ -59,9 +100,7 @@ def check_python_version():
 
 def get_venv_path():
     """Get the virtual environment path"""
-    script_dir = Path(__file__).parent
-    venv_path = script_dir / 'venv'
-    return venv_path
+    return _SCRIPT_DIR / 'venv'
 
 def create_venv(venv_path):
     """Create virtual environment if it doesn't exist"""
@@ -73,28 +112,85 @@ def create_venv(venv_path):
     
     try:
         print_info(f"Creating virtual environment at {venv_path}...")
-        venv.create(venv_path, with_pip=True, upgrade_deps=False)
+        # pip is bootstrapped separately (see bootstrap_pip) so it can overlap other work.
+        # Symlink the interpreter on POSIX; symlinks can need admin rights on Windows.
+        venv.create(venv_path, with_pip=False, clear=False, symlinks=not _IS_WINDOWS)
         print_success("Virtual environment created successfully")
         return True
     except Exception as e:
         print_error(f"Failed to create virtual environment: {e}")
         return False
 
-def get_pip_command(venv_path):
-    """Get the pip command for the virtual environment"""
-    if sys.platform == 'win32':
-        return str(venv_path / 'Scripts' / 'pip.exe')
-    else:
-        return str(venv_path / 'bin' / 'pip')
+def bootstrap_pip(python_cmd):
+    """Install pip into a venv created without it (what venv's with_pip=True runs)"""
+    subprocess.run(
+        [python_cmd, '-m', 'ensurepip', '--upgrade', '--default-pip'],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+def pip_argv(python_cmd):
+    """Run pip through the venv interpreter in isolated mode (no launcher shim)"""
+    return [python_cmd, '-Im', 'pip']
 
 def get_python_command(venv_path):
     """Get the python command for the virtual environment"""
-    if sys.platform == 'win32':
-        return str(venv_path / 'Scripts' / 'python.exe')
-    else:
-        return str(venv_path / 'bin' / 'python')
+    return str(venv_path / _VENV_BIN / _PY_EXE)
+
+def requirements_digest(req_file):
+    """Hash requirements.txt together with the interpreter version and platform"""
+    digest = hashlib.sha256(req_file.read_bytes())
+    digest.update(f"\n{sys.version}\n{sys.platform}".encode())
+    return digest.hexdigest()
 
-def upgrade_pip(pip_cmd):
+def venv_is_fresh(venv_path, req_file):
+    """Check that the venv exists and was last installed from this requirements.txt"""
+    marker = venv_path / REQ_DIGEST_FILE
+    if not (marker.exists() and req_file.exists()):
+        return False
+    if not Path(get_python_command(venv_path)).exists():
+        return False
+    return marker.read_text().strip() == requirements_digest(req_file)
+
+def record_requirements(venv_path, req_file):
+    """Store the digest of the requirements that were just installed"""
+    (venv_path / REQ_DIGEST_FILE).write_text(requirements_digest(req_file))
+
+def run_streaming(argv, env=None):
+    """Run a command, echoing its key output lines with elapsed time (raises like check_call)"""
+    start = time.monotonic()
+    recent = deque(maxlen=20)
+    with subprocess.Popen(
+        argv,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=1,
+        text=True,
+        env=env
+    ) as proc:
+        for line in proc.stdout:
+            line = line.rstrip()
+            if line.startswith(PIP_EVENTS):
+                print(f"  [{time.monotonic() - start:6.1f}s] {line}")
+            elif line:
+                recent.append(line)
+    
+    if proc.returncode != 0:
+        for line in recent:
+            print(f"  {line}")
+        raise subprocess.CalledProcessError(proc.returncode, argv)
+
+def pip_env(cache_dir=None, index_url=None):
+    """Environment for pip subprocesses, with optional shared cache and index mirror"""
+    env = os.environ.copy()
+    if cache_dir:
+        env['PIP_CACHE_DIR'] = str(cache_dir)
+    if index_url:
+        env['PIP_INDEX_URL'] = index_url
+    return env
+
+def upgrade_pip(python_cmd, env=None):
     """Upgrade pip, setuptools, and wheel"""
     print_header("Upgrading pip, setuptools, and wheel")
     
@@ -102,15 +198,88 @@ def upgrade_pip(pip_cmd):
     print_info(f"Upgrading: {', '.join(packages)}...")
     
     try:
-        subprocess.check_call([pip_cmd, 'install', '--upgrade'] + packages)
+        run_streaming(pip_argv(python_cmd) + ['install', *PIP_BASE, '--upgrade'] + packages, env=env)
         print_success("pip, setuptools, and wheel upgraded successfully")
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to upgrade packages: {e}")
         return False
 
-def install_requirements(pip_cmd, venv_path):
-    """Install requirements from requirements.txt"""
+def ensure_lockfile(req_file, lock_file, env=None):
+    """Regenerate the lockfile with pip-compile if requirements.txt is newer; return whether it is usable"""
+    if lock_file.exists() and lock_file.stat().st_mtime >= req_file.stat().st_mtime:
+        return True
+    
+    pip_compile = shutil.which('pip-compile')
+    if not pip_compile:
+        if lock_file.exists():
+            print_warning(f"{lock_file.name} is older than requirements.txt and pip-compile is not installed, ignoring it")
+        return False
+    
+    print_info(f"Locking {req_file.name} into {lock_file.name}...")
+    try:
+        subprocess.check_call(
+            [pip_compile, '--quiet', '--generate-hashes', '--output-file', str(lock_file), str(req_file)],
+            env=env
+        )
+        print_success(f"{lock_file.name} updated")
+        return True
+    except subprocess.CalledProcessError as e:
+        print_warning(f"pip-compile failed ({e}), installing from requirements.txt")
+        return False
+
+def parse_requirements(req_file):
+    """Requirement specifiers from a requirements or lock file (options and hashes dropped)"""
+    specs = []
+    for line in req_file.read_text().replace('\\\n', ' ').splitlines():
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith(('#', '-')):
+            continue
+        specs.append(line.split(' --', 1)[0].strip())
+    return specs
+
+def prefetch_wheels(python_cmd, req_file, wheelhouse, env=None, locked=False):
+    """Download requirements into a local wheelhouse with parallel `pip download` runs"""
+    specs = list(dict.fromkeys(['pip', 'setuptools', 'wheel'] + parse_requirements(req_file)))
+    workers = min(8, os.cpu_count() or 1)
+    wheelhouse.mkdir(exist_ok=True)
+    print_info(f"Prefetching {len(specs)} requirements into {wheelhouse} ({workers} workers)...")
+    
+    download = pip_argv(python_cmd) + ['download', *PIP_BASE, '--dest', str(wheelhouse)]
+    
+    # --no-deps keeps workers from each fetching the shared dependency tree
+    # (numpy for pandas and scikit-learn, ...). Each worker just waits on its
+    # own pip process, so threads are enough.
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(subprocess.run, download + ['--no-deps', spec], capture_output=True, env=env)
+            for spec in specs
+        ]
+        failed = [spec for spec, future in zip(specs, futures) if future.result().returncode != 0]
+    
+    # A lockfile already lists every transitive dependency. For requirements.txt,
+    # one resolving pass fetches whatever is still missing; files already in the
+    # wheelhouse are not downloaded again.
+    if not failed and not locked:
+        result = subprocess.run(download + ['-r', str(req_file)], capture_output=True, env=env)
+        if result.returncode != 0:
+            failed = [f"dependencies of {req_file.name}"]
+    
+    if failed:
+        print_warning(f"Could not prefetch {', '.join(failed)}, installing from the package index")
+        return False
+    
+    print_success("Wheelhouse is up to date")
+    return True
+
+def wheelhouse_args(python_cmd, req_file, wheelhouse, env=None, locked=False):
+    """pip install args for an offline install from the wheelhouse, if it could be filled"""
+    if wheelhouse and prefetch_wheels(python_cmd, req_file, wheelhouse, env, locked):
+        return ['--no-index', '--find-links', str(wheelhouse)]
+    return []
+
+def install_requirements(python_cmd, venv_path, env=None, lock_file=None, wheelhouse=None):
+    """Install requirements from requirements.txt, or from the hashed lockfile if given"""
     print_header("Installing Dependencies")
     
     req_file = venv_path.parent / 'requirements.txt'
@@ -119,42 +288,161 @@ def install_requirements(pip_cmd, venv_path):
         print_error(f"requirements.txt not found at {req_file}")
         return False
     
-    print_info(f"Installing from {req_file}...")
+    # A hashed lockfile is already fully resolved, so pip can skip the resolver
+    if lock_file:
+        install_args = ['--no-deps', '--require-hashes', '-r', str(lock_file)]
+    else:
+        install_args = ['-r', str(req_file)]
+    install_args += wheelhouse_args(python_cmd, lock_file or req_file, wheelhouse, env, locked=bool(lock_file))
+    
+    print_info(f"Installing from {lock_file or req_file}...")
     
     try:
-        subprocess.check_call([pip_cmd, 'install', '-r', str(req_file)])
+        run_streaming(pip_argv(python_cmd) + ['install', *PIP_BASE] + install_args, env=env)
+        record_requirements(venv_path, req_file)
         print_success("Dependencies installed successfully")
         return True
     except subprocess.CalledProcessError as e:
         print_error(f"Failed to install dependencies: {e}")
         return False
 
-def validate_installation(python_cmd):
-    """Validate that key packages are installed"""
-    print_header("Validating Installation")
+def install_all(python_cmd, venv_path, req_file, env=None, wheelhouse=None):
+    """Upgrade pip/setuptools/wheel and install requirements in one pip run"""
+    print_header("Installing Dependencies")
     
-    packages = [
-        'flask',
-        'flask_cors',
-        'plexapi',
-        'dotenv',
-        'requests'
-    ]
+    if not req_file.exists():
+        print_error(f"requirements.txt not found at {req_file}")
+        return False
     
-    print_info("Checking for required packages...")
+    offline_args = wheelhouse_args(python_cmd, req_file, wheelhouse, env)
     
-    for package in packages:
-        try:
-            # Use Python to import and check each package
+    print_info(f"Upgrading pip, setuptools, and wheel and installing from {req_file}...")
+    
+    # Keep pip's cache enabled so sdists built here are reused as wheels on re-runs
+    try:
+        run_streaming(
+            pip_argv(python_cmd)
+            + ['install', *PIP_BASE, '--upgrade', 'pip', 'setuptools', 'wheel', '-r', str(req_file)]
+            + offline_args,
+            env=env
+        )
+        record_requirements(venv_path, req_file)
+        print_success("Dependencies installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print_error(f"Failed to install dependencies: {e}")
+        return False
+
+def try_uv_fast_path(venv_path, req_file, index_url=None, cache_dir=None, lock_file=None):
+    """Create the venv and install requirements (or the lockfile) with uv, if it is available"""
+    uv_cmd = shutil.which('uv')
+    if not uv_cmd:
+        return False
+    
+    print_header("Installing with uv")
+    
+    if not req_file.exists():
+        print_error(f"requirements.txt not found at {req_file}")
+        return False
+    
+    # uv keeps its own cache format, so --cache-dir is passed through rather than PIP_CACHE_DIR
+    cache_args = ['--cache-dir', str(cache_dir)] if cache_dir else []
+    
+    try:
+        if venv_path.exists():
+            print_warning(f"Virtual environment already exists at {venv_path}")
+        else:
+            print_info(f"Creating virtual environment at {venv_path}...")
             subprocess.check_call(
-                [python_cmd, '-c', f'import {package}'],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL
+                [uv_cmd, 'venv', '--seed', str(venv_path), '--python', sys.executable] + cache_args
             )
+        
+        print_info(f"Installing from {lock_file or req_file}...")
+        uv_args = [uv_cmd, 'pip', 'install', '--python', get_python_command(venv_path)] + cache_args
+        if lock_file:
+            uv_args += ['--no-deps', '--require-hashes', '-r', str(lock_file)]
+        else:
+            uv_args += ['-r', str(req_file)]
+        if index_url:
+            uv_args += ['--index-url', index_url]
+        subprocess.check_call(uv_args)
+        record_requirements(venv_path, req_file)
+        print_success("Dependencies installed successfully")
+        return True
+    except subprocess.CalledProcessError as e:
+        print_warning(f"uv install failed ({e}), falling back to venv + pip")
+        return False
+
+def normalize_dist_name(name):
+    """Normalize a distribution name for comparison (PEP 503)"""
+    return re.sub(r'[-_.]+', '-', name).lower()
+
+def get_venv_version(venv_path):
+    """Major.minor version of the venv's own interpreter, read from pyvenv.cfg"""
+    try:
+        config = (venv_path / 'pyvenv.cfg').read_text(encoding='utf-8')
+    except OSError:
+        return None
+    # venv writes `version`, uv writes `version_info`
+    match = re.search(r'^version(?:_info)?\s*=\s*(\d+)\.(\d+)', config, re.MULTILINE)
+    return f"{match.group(1)}.{match.group(2)}" if match else None
+
+def get_site_packages(venv_path):
+    """Get the site-packages directory of the virtual environment"""
+    if _IS_WINDOWS:
+        return venv_path / 'Lib' / 'site-packages'
+    
+    # The venv may have been created by a different Python than the one running setup
+    version = get_venv_version(venv_path)
+    if version:
+        return venv_path / 'lib' / f'python{version}' / 'site-packages'
+    candidates = sorted((venv_path / 'lib').glob('python*/site-packages'))
+    return candidates[0] if candidates else venv_path / 'lib' / 'site-packages'
+
+def venv_has_pip(venv_path):
+    """Check whether pip made it into the venv (a bootstrap can be interrupted after venv creation)"""
+    return (get_site_packages(venv_path) / 'pip').is_dir()
+
+def installed_distributions(venv_path):
+    """Normalized names of the distributions installed in the venv, read from dist-info METADATA"""
+    site_packages = get_site_packages(venv_path)
+    if not site_packages.is_dir():
+        return set()
+    
+    names = set()
+    with os.scandir(site_packages) as entries:
+        for entry in entries:
+            if not entry.name.endswith('.dist-info'):
+                continue
+            try:
+                with open(os.path.join(entry.path, 'METADATA'), encoding='utf-8') as metadata:
+                    for line in metadata:
+                        if line.startswith('Name:'):
+                            names.add(normalize_dist_name(line[5:].strip()))
+                            break
+                        if not line.strip():
+                            break  # end of the header block
+            except OSError:
+                continue
+    return names
+
+def validate_installation(venv_path):
+    """Validate that key packages are installed"""
+    print_header("Validating Installation")
+    
+    print_info("Checking for required packages...")
+    
+    installed = installed_distributions(venv_path)
+    missing = False
+    for package, dist_name in REQUIRED_PACKAGES.items():
+        if normalize_dist_name(dist_name) in installed:
             print_success(f"{package} is installed")
-        except subprocess.CalledProcessError:
+        else:
             print_error(f"{package} is NOT installed")
-            return False
+            missing = True
+    
+    if missing:
+        return False
     
     print_success("All required packages are installed")
     return True
@@ -181,8 +469,39 @@ def setup_env_file(venv_path):
     print_warning("Neither .env.local nor .env.local.template found")
     return True
 
+def parse_args():
+    """Parse command-line options"""
+    parser = argparse.ArgumentParser(description='Set up the PlexM8 Python backend')
+    parser.add_argument(
+        '--staged',
+        action='store_true',
+        help='upgrade pip/setuptools/wheel before resolving requirements, in a separate pip run'
+    )
+    parser.add_argument(
+        '--cache-dir',
+        help='pip cache directory to reuse across runs (default: $PIP_CACHE_DIR or pip\'s own)'
+    )
+    parser.add_argument(
+        '--index-url',
+        default=os.environ.get('PIP_INDEX_URL'),
+        help='package index to install from, e.g. a local devpi mirror (default: $PIP_INDEX_URL or PyPI)'
+    )
+    parser.add_argument(
+        '--wheelhouse',
+        action='store_true',
+        help='download wheels in parallel into ./wheelhouse first, then install offline from it'
+    )
+    parser.add_argument(
+        '--no-uv',
+        action='store_true',
+        help='always use venv + pip, even when uv is installed'
+    )
+    return parser.parse_args()
+
 def main():
     """Main setup function"""
+    args = parse_args()
+    
     print(f"\n{Colors.BOLD}{Colors.BLUE}PlexM8 Python Backend Setup{Colors.RESET}")
     print(f"{Colors.BLUE}Automated environment configuration{Colors.RESET}\n")
     
@@ -193,43 +512,83 @@ def main():
     venv_path = get_venv_path()
     print_info(f"Virtual environment path: {venv_path}")
     
-    # Step 3: Create venv
-    if not create_venv(venv_path):
-        print_error("Setup failed at virtual environment creation")
-        sys.exit(1)
-    
-    # Get commands for venv
-    pip_cmd = get_pip_command(venv_path)
+    req_file = venv_path.parent / 'requirements.txt'
     python_cmd = get_python_command(venv_path)
     
-    # Step 4: Upgrade pip/setuptools/wheel
-    if not upgrade_pip(pip_cmd):
-        print_error("Setup failed at pip upgrade")
-        sys.exit(1)
+    config_checked = False
     
-    # Step 5: Install requirements
-    if not install_requirements(pip_cmd, venv_path):
-        print_error("Setup failed at dependency installation")
-        sys.exit(1)
+    # Steps 3-4: Create venv and install dependencies (uv when available),
+    # skipped entirely when the venv already matches requirements.txt
+    if venv_is_fresh(venv_path, req_file):
+        print_success("Virtual environment is up to date with requirements.txt, skipping installation")
+    else:
+        env = pip_env(args.cache_dir, args.index_url)
+        lock_file = venv_path.parent / LOCK_FILE
+        if not ensure_lockfile(req_file, lock_file, env):
+            lock_file = None
+        
+        # --staged and --wheelhouse are pip workflows; uv only serves the default install
+        use_uv = not (args.no_uv or args.staged or args.wheelhouse)
+        if (args.staged or args.wheelhouse) and shutil.which('uv'):
+            print_info("--staged/--wheelhouse use pip, not uv")
+        
+        if not (use_uv and try_uv_fast_path(venv_path, req_file, args.index_url, args.cache_dir, lock_file)):
+            if not create_venv(venv_path):
+                print_error("Setup failed at virtual environment creation")
+                sys.exit(1)
+            
+            if not venv_has_pip(venv_path):
+                # Bootstrap pip in the background while checking configuration
+                with ThreadPoolExecutor(max_workers=1) as executor:
+                    pip_future = executor.submit(bootstrap_pip, python_cmd)
+                    setup_env_file(venv_path)
+                    config_checked = True
+                    try:
+                        pip_future.result()
+                        print_success("pip installed into virtual environment")
+                    except subprocess.CalledProcessError as e:
+                        print_error(f"Failed to install pip: {e.stderr.strip() or e}")
+                        print_error("Setup failed at virtual environment creation")
+                        sys.exit(1)
+            
+            wheelhouse = venv_path.parent / WHEELHOUSE_DIR if args.wheelhouse else None
+            
+            if args.staged:
+                if not upgrade_pip(python_cmd, env):
+                    print_error("Setup failed at pip upgrade")
+                    sys.exit(1)
+                installed = install_requirements(python_cmd, venv_path, env, lock_file, wheelhouse)
+            elif lock_file:
+                # --require-hashes can't be mixed with the unpinned pip/setuptools/wheel upgrade
+                installed = install_requirements(python_cmd, venv_path, env, lock_file, wheelhouse)
+            else:
+                installed = install_all(python_cmd, venv_path, req_file, env, wheelhouse)
+            
+            if not installed:
+                print_error("Setup failed at dependency installation")
+                sys.exit(1)
+    
+    # Step 5: Check configuration (already done if it overlapped the pip bootstrap)
+    if not config_checked:
+        setup_env_file(venv_path)
     
     # Step 6: Validate installation
-    if not validate_installation(python_cmd):
+    if not validate_installation(venv_path):
         print_error("Setup failed at validation")
         sys.exit(1)
     
-    # Step 7: Check configuration
-    setup_env_file(venv_path)
-    
     # Final summary
     print_header("Setup Complete!")
     print_success("PlexM8 backend environment is ready")
     
-    activate_cmd = f"venv\\Scripts\\Activate.ps1" if sys.platform == 'win32' else "source venv/bin/activate"
-    print_info(f"\nTo activate the environment:")
-    print_info(f"  {activate_cmd}")
-    print_info(f"\nTo start the backend:")
-    print_info(f"  python app.py")
-    print(f"\n{Colors.GREEN}Happy coding!{Colors.RESET}\n")
+    activate_cmd = "venv\\Scripts\\Activate.ps1" if _IS_WINDOWS else "source venv/bin/activate"
+    print(
+        f"\n{Colors.BLUE}ℹ To activate the environment:\n"
+        f"ℹ   {activate_cmd}\n"
+        f"\nℹ To start the backend:\n"
+        f"ℹ   python app.py{Colors.RESET}\n"
+        f"\n{Colors.GREEN}Happy coding!{Colors.RESET}\n"
+    )
 
 if __name__ == '__main__':
     try: